@@ -1,126 +1,210 @@
+import importlib
+import os
+
 import streamlit as st
+from streamlit.runtime.scriptrunner import RerunException, StopException
 from utils.styles import apply_custom_styles
 from utils.data_utils import load_model, train_model_with_progress
-from page_modules.play_predictor import play_predictor_page
-from page_modules.analytics_dashboard import analytics_dashboard_page
-from page_modules.model_insights import model_insights_page
-from page_modules.scenario_simulator import scenario_simulator_page
-from page_modules.data_explorer import data_explorer_page
-from page_modules.player_matchup_analyzer import player_matchup_analyzer_page
-
-st.set_page_config(
-    page_title="NFL Play Intelligence System",
-    page_icon="⚡",
-    layout="wide",
-    initial_sidebar_state="expanded",
-    menu_items={
-        'Get Help': None,
-        'Report a bug': None,
-        'About': "NFL Expected Yards & Play Calling Intelligence System - AI-powered play recommendations for optimal offensive strategy."
-    }
-)
 
-apply_custom_styles()
+# Page registry: display name -> (module, page function, whether it takes the model)
+_PAGES = {
+    "Play Predictor": ("page_modules.play_predictor", "play_predictor_page", True),
+    "Analytics Dashboard": ("page_modules.analytics_dashboard", "analytics_dashboard_page", False),
+    "Model Insights": ("page_modules.model_insights", "model_insights_page", True),
+    "Scenario Simulator": ("page_modules.scenario_simulator", "scenario_simulator_page", True),
+    "Data Explorer": ("page_modules.data_explorer", "data_explorer_page", False),
+    "Player Matchup Analyzer": ("page_modules.player_matchup_analyzer", "player_matchup_analyzer_page", True),
+}
+
+# Deployment feature flags, so variants of the app share this one script
+FEATURES = {
+    "player_matchup": os.getenv("NFL_ENABLE_MATCHUP", "1") == "1",
+}
+
+if not FEATURES["player_matchup"]:
+    _PAGES.pop("Player Matchup Analyzer")
+
+@st.cache_resource(show_spinner=False)
+def _import_page(page):
+    """Resolve a page function once per process; later lookups skip the import machinery"""
+    module_name, fn_name, _ = _PAGES[page]
+    return getattr(importlib.import_module(module_name), fn_name)
+
+def _init_app():
+    """Per-run setup: page config once per session, then the CSS payload.
+
+    The CSS is a markdown element, and Streamlit prunes any element that a
+    full script run does not re-emit — so the styles must be injected on
+    every run, not just the first.
+    """
+    if not st.session_state.get("_app_inited"):
+        st.set_page_config(
+            page_title="NFL Play Intelligence System",
+            page_icon="⚡",
+            layout="wide",
+            initial_sidebar_state="expanded",
+            menu_items={
+                'Get Help': None,
+                'Report a bug': None,
+                'About': "NFL Expected Yards & Play Calling Intelligence System - AI-powered play recommendations for optimal offensive strategy."
+            }
+        )
+        st.session_state["_app_inited"] = True
+    apply_custom_styles()
+
+_init_app()
+
+# Static sidebar content built once at import so reruns skip the string work
+_SIDEBAR_TITLE_HTML = '<div class="sidebar-title">Navigation</div>'
+
+_SIDEBAR_DATA_INFO_MD = """
+**Source:** nflfastR Public Repository
+**Coverage:** NFL Seasons 2021-2024
+**Size:** Automatically downloaded
+**Updates:** Real-time from public APIs
+"""
+
+@st.cache_data(show_spinner=False)
+def _status_html(model_ready):
+    """Return the System Status markdown for the given model state (two cache entries total)"""
+    if model_ready:
+        return (
+            '<span class="status-indicator status-success"></span>**Model:** Ready\n\n'
+            '<span class="status-indicator status-success"></span>**Data:** Loaded'
+        )
+    return (
+        '<span class="status-indicator status-warning"></span>**Model:** Not Trained\n\n'
+        "🎯 *Click 'Train Model' to begin*"
+    )
+
+def _ensure_model():
+    """Fetch the model handle from session_state, loading it on first access"""
+    if "model" not in st.session_state:
+        st.session_state.model = load_model()
+    return st.session_state.model
 
 def render_sidebar():
     with st.sidebar:
-        st.markdown('<div class="sidebar-title">Navigation</div>', unsafe_allow_html=True)
-        
-        page = st.selectbox(
-            "Select Analysis Page:",
-            [
-                "Play Predictor",
-                "Analytics Dashboard", 
-                "Model Insights",
-                "Scenario Simulator",
-                "Data Explorer",
-                "Player Matchup Analyzer"
-            ],
-            help="Choose the analysis section you want to explore"
-        )
-        
+        st.markdown(_SIDEBAR_TITLE_HTML, unsafe_allow_html=True)
+
         st.markdown("---")
-        
+
         st.markdown("### Data Information")
-        st.markdown("""
-        **Source:** nflfastR Public Repository  
-        **Coverage:** NFL Seasons 2021-2024  
-        **Size:** Automatically downloaded  
-        **Updates:** Real-time from public APIs
-        """)
-        
+        st.markdown(_SIDEBAR_DATA_INFO_MD)
+
         st.markdown("---")
-        
+
         st.markdown("### System Status")
-        model = load_model()
-        if model:
-            st.markdown('<span class="status-indicator status-success"></span>**Model:** Ready', unsafe_allow_html=True)
-            st.markdown('<span class="status-indicator status-success"></span>**Data:** Loaded', unsafe_allow_html=True)
-        else:
-            st.markdown('<span class="status-indicator status-warning"></span>**Model:** Not Trained', unsafe_allow_html=True)
-            st.markdown("🎯 *Click 'Train Model' to begin*")
-        
-        return page, model
+        model = _ensure_model()
+        st.markdown(_status_html(model is not None), unsafe_allow_html=True)
+
+# Home-page context cards, assembled once at import from a shared card template
+_CARD_TMPL = (
+    '<div style="flex: 1; background: {bg}; border-radius: 12px; '
+    'padding: 1.5rem; box-shadow: 0 2px 8px #0001;">{body}</div>'
+)
+
+_WHAT_BODY = (
+    '<h3 style="margin-top: 0;">🏈 What is NFL Play Intelligence?</h3>'
+    '<p>This project is an AI-powered web app that predicts expected yards for NFL plays '
+    'and recommends optimal offensive strategies. It helps coaches, analysts, and fans '
+    'explore play-calling effectiveness, simulate scenarios, and analyze player matchups '
+    'using real NFL data.</p>'
+)
+
+_HOW_BODY = (
+    '<h3 style="margin-top: 0;">⚙️ How Does It Work?</h3>'
+    '<ul>'
+    '<li>Downloads real NFL play-by-play data (2021-2024) from public sources</li>'
+    '<li>Engineers 30+ features (down, distance, field position, game context, etc.)</li>'
+    '<li>Trains a machine learning model (XGBoost) to predict expected yards for run/pass</li>'
+    '<li>Provides explainable recommendations and analytics for any game situation</li>'
+    '</ul>'
+)
+
+_USE_BODY = (
+    '<h3 style="margin-top: 0;">🚀 How to Use</h3>'
+    '<ol>'
+    '<li>Train the model (if not already trained) using the button at the top</li>'
+    '<li>Explore different pages: Play Predictor, Analytics Dashboard, Model Insights, etc.</li>'
+    '<li>Input game situations to get predictions and recommendations</li>'
+    '<li>Analyze trends, simulate scenarios, and dive into player matchups</li>'
+    '</ol>'
+)
+
+_HOME_CARDS_HTML = (
+    '<div style="display: flex; gap: 2rem; margin-bottom: 2rem;">'
+    + "".join([
+        _CARD_TMPL.format(bg="#f1f5f9", body=_WHAT_BODY),
+        _CARD_TMPL.format(bg="#f8fafc", body=_HOW_BODY),
+        _CARD_TMPL.format(bg="#f1f5f9", body=_USE_BODY),
+    ])
+    + '</div>'
+)
+
+@st.fragment
+def _render_home_cards():
+    """Emit the context cards in their own fragment so parent reruns keep the DOM stable"""
+    st.markdown(_HOME_CARDS_HTML, unsafe_allow_html=True)
+
+@st.fragment
+def _train_fragment():
+    """Training button in its own fragment so the post-training refresh stays scoped"""
+    if _ensure_model() is not None:
+        st.success("Model trained and ready — pick a page to continue.")
+        return
+    # Latch on a session flag so a stray rerun or double click can't re-enter training
+    if st.session_state.get("_training"):
+        st.info("Training in progress...")
+        return
+    if st.button("🎯 Train Model", type="primary", help="Start the AI model training process", use_container_width=True):
+        st.markdown("---")
+        st.session_state["_training"] = True
+        try:
+            success = train_model_with_progress()
+        finally:
+            st.session_state["_training"] = False
+        if success:
+            st.session_state.pop("model", None)
+            st.balloons()
+            st.rerun(scope="fragment")
 
 def route_to_page(page, model):
     # Show context cards on the home page (Play Predictor)
     if page == "Play Predictor":
-        st.markdown("""
-        <div style="display: flex; gap: 2rem; margin-bottom: 2rem;">
-            <div style="flex: 1; background: #f1f5f9; border-radius: 12px; padding: 1.5rem; box-shadow: 0 2px 8px #0001;">
-                <h3 style="margin-top: 0;">🏈 What is NFL Play Intelligence?</h3>
-                <p>This project is an AI-powered web app that predicts expected yards for NFL plays and recommends optimal offensive strategies. It helps coaches, analysts, and fans explore play-calling effectiveness, simulate scenarios, and analyze player matchups using real NFL data.</p>
-            </div>
-            <div style="flex: 1; background: #f8fafc; border-radius: 12px; padding: 1.5rem; box-shadow: 0 2px 8px #0001;">
-                <h3 style="margin-top: 0;">⚙️ How Does It Work?</h3>
-                <ul>
-                    <li>Downloads real NFL play-by-play data (2021-2024) from public sources</li>
-                    <li>Engineers 30+ features (down, distance, field position, game context, etc.)</li>
-                    <li>Trains a machine learning model (XGBoost) to predict expected yards for run/pass</li>
-                    <li>Provides explainable recommendations and analytics for any game situation</li>
-                </ul>
-            </div>
-            <div style="flex: 1; background: #f1f5f9; border-radius: 12px; padding: 1.5rem; box-shadow: 0 2px 8px #0001;">
-                <h3 style="margin-top: 0;">🚀 How to Use</h3>
-                <ol>
-                    <li>Train the model (if not already trained) using the button at the top</li>
-                    <li>Explore different pages: Play Predictor, Analytics Dashboard, Model Insights, etc.</li>
-                    <li>Input game situations to get predictions and recommendations</li>
-                    <li>Analyze trends, simulate scenarios, and dive into player matchups</li>
-                </ol>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        _render_home_cards()
     if model is None:
         st.warning("The model is not trained. Please train the model to use the app.")
-        if st.button("🎯 Train Model", type="primary", help="Start the AI model training process", use_container_width=True):
-            st.markdown("---")
-            success = train_model_with_progress()
-            if success:
-                st.balloons()
-                st.rerun()
+        _train_fragment()
         return
     try:
-        if page == "Play Predictor":
-            play_predictor_page(model)
-        elif page == "Analytics Dashboard":
-            analytics_dashboard_page()
-        elif page == "Model Insights":
-            model_insights_page(model)
-        elif page == "Scenario Simulator":
-            scenario_simulator_page(model)
-        elif page == "Data Explorer":
-            data_explorer_page()
-        elif page == "Player Matchup Analyzer":
-            player_matchup_analyzer_page(model)
+        # Pages resolve through the registry, imported lazily on first visit
+        page_fn = _import_page(page)
+        needs_model = _PAGES[page][2]
+        page_fn(model) if needs_model else page_fn()
+    except (StopException, RerunException):
+        # Streamlit's own control flow (st.stop / st.rerun) must propagate
+        raise
     except Exception as e:
         st.error(f"**Page Error:** {str(e)}")
         st.info("Please refresh the page or try a different section.")
 
+def _make_page(page):
+    """Wrap a registry entry as a zero-arg callable for st.navigation"""
+    def _run():
+        route_to_page(page, _ensure_model())
+    _run.__name__ = page.lower().replace(" ", "_")
+    return _run
+
 def main():
-    page, model = render_sidebar()
-    
-    route_to_page(page, model)
+    nav = st.navigation(
+        [
+            st.Page(_make_page(page), title=page, default=(page == "Play Predictor"))
+            for page in _PAGES
+        ]
+    )
+    render_sidebar()
+    nav.run()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
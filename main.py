@@ -1,12 +1,14 @@
-from src.data_processing import load_and_prepare_data, get_play_features
+from src.data_processing import load_and_prepare_data, get_play_features, save_prepared_data
 from src.model import ExpectedYardsModel
-import os
 
 def main():
     try:
         # load and prepare all data using the streamlined pipeline
         X, y, feature_names, raw_df = load_and_prepare_data()
-        
+
+        # Cache the engineered frame so the app can load it without re-downloading
+        save_prepared_data(raw_df)
+
         model = ExpectedYardsModel(model_type='xgboost')
         trained_model = model.train_model(X, y, feature_names)
         
@@ -1,8 +1,108 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 from utils.data_utils import load_data
 
+_PLAY_COLORS = (('run', '#ef4444'), ('pass', '#3b82f6'))
+
+# Aggregations are cached on a row-count fingerprint (the frame itself is an
+# unhashed _df argument) so dashboard reruns are dict lookups, not pandas scans
+
+def _is_pass(df):
+    # int8 code comparison for categorical play_type; one N-length compare
+    # shared by the KPIs and both aggregation kernels
+    play_type = df['play_type']
+    if isinstance(play_type.dtype, pd.CategoricalDtype):
+        code = play_type.cat.categories.get_indexer(['pass'])[0]
+        if code < 0:
+            return np.zeros(len(df), dtype=bool)
+        return play_type.cat.codes.to_numpy() == code
+    return play_type.to_numpy() == 'pass'
+
+def _conv_flag(df):
+    # materialized during feature engineering; only derive it for frames
+    # that predate the stored column
+    if 'conv_flag' in df.columns:
+        return df['conv_flag']
+    return pd.Series(
+        df['yards_gained'].values >= df['ydstogo'].values,
+        index=df.index, name='conv_flag'
+    )
+
+@st.cache_data(show_spinner=False)
+def _by_down_stats(n_rows, _df):
+    conv_flag = _conv_flag(_df)
+    return _df[['yards_gained']].assign(conv=conv_flag).groupby(_df['down'], observed=True, sort=False).agg(
+        avg_yards=('yards_gained', 'mean'),
+        play_count=('yards_gained', 'count'),
+        conv_rate=('conv', 'mean')
+    )
+
+@st.cache_data(show_spinner=False)
+def _down_play_aggs(n_rows, _df):
+    # one scan over raw arrays yields both per-(down, play type) frames the
+    # page charts: yardage means and success rates share the same flat-index
+    # bincounts instead of two separate groupby passes
+    down = _df['down'].to_numpy()
+    is_pass = _is_pass(_df)
+    yards = _df['yards_gained'].to_numpy(dtype=np.float64)
+    conv = _conv_flag(_df).to_numpy(dtype=np.float64)
+
+    n_downs = int(down.max()) if len(down) else 0
+    n_buckets = n_downs * 2
+    flat = (down - 1) * 2 + is_pass
+    counts = np.bincount(flat, minlength=n_buckets)
+    sums = np.bincount(flat, weights=yards, minlength=n_buckets)
+    successes = np.bincount(flat, weights=conv, minlength=n_buckets)
+    means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+    rates = np.divide(successes, counts, out=np.zeros_like(successes), where=counts > 0)
+
+    populated = counts > 0
+    downs = np.repeat(np.arange(1, n_downs + 1), 2)[populated]
+    play_types = np.tile(['run', 'pass'], n_downs)[populated]
+    effectiveness = pd.DataFrame({
+        'down': downs,
+        'play_type': play_types,
+        'yards_gained': means[populated],
+    })
+    success = pd.DataFrame({
+        'down': downs,
+        'play_type': play_types,
+        'success_rate': rates[populated],
+        'total_plays': counts[populated],
+    })
+    return effectiveness, success
+
+_ZONE_LABELS = ['Goal Line (1-10)', 'Red Zone (11-20)', 'Short Field (21-40)', 'Mid Field (41-60)', 'Long Field (61+)']
+
+@st.cache_data(show_spinner=False)
+def _zone_analysis(n_rows, _df):
+    # one pass over raw arrays: sums and counts per (zone, play type) come
+    # from two bincounts on a flat index instead of pd.cut + groupby
+    if 'field_zone' in _df.columns and isinstance(_df['field_zone'].dtype, pd.CategoricalDtype):
+        zone_idx = _df['field_zone'].cat.codes.to_numpy()
+    else:
+        zone_idx = np.digitize(_df['distance_to_goal'].to_numpy(), [10, 20, 40, 60], right=True)
+    is_pass = _is_pass(_df)
+    yards = _df['yards_gained'].to_numpy(dtype=np.float64)
+
+    valid = zone_idx >= 0
+    flat = zone_idx[valid] * 2 + is_pass[valid]
+    n_buckets = len(_ZONE_LABELS) * 2
+    counts = np.bincount(flat, minlength=n_buckets)
+    sums = np.bincount(flat, weights=yards[valid], minlength=n_buckets)
+    means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+
+    populated = counts > 0
+    return pd.DataFrame({
+        'field_zone': np.repeat(_ZONE_LABELS, 2)[populated],
+        'play_type': np.tile(['run', 'pass'], len(_ZONE_LABELS))[populated],
+        'Average Yards': means[populated].round(2),
+        'Play Count': counts[populated],
+    })
+
 def analytics_dashboard_page():
     df = load_data()
     if df is None:
@@ -13,166 +113,156 @@ def analytics_dashboard_page():
     
     # key performance indicators
     st.markdown('<div class="subsection-header">Key Performance Indicators</div>', unsafe_allow_html=True)
-    
+
+    # one cached pass over the frame covers every per-down stat the page needs
+    by_down = _by_down_stats(len(df), df)
+
+    # raw column arrays pulled once; every KPI below works on these instead of
+    # materializing row subsets of the full frame
+    yards = df['yards_gained'].to_numpy()
+    is_pass = _is_pass(df)
+    rz_mask = (df['red_zone'].to_numpy() == 1) if 'red_zone' in df.columns \
+        else (df['distance_to_goal'].to_numpy() <= 20)
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        avg_yards = df['yards_gained'].mean()
+        avg_yards = yards.mean()
         st.metric(
             "Average Yards per Play",
             f"{avg_yards:.2f}",
             delta=f"{avg_yards - 4.8:.2f} vs NFL average"
         )
-    
+
     with col2:
-        pass_pct = (df['play_type'] == 'pass').mean() * 100
+        pass_pct = is_pass.mean() * 100
         st.metric(
             "Pass Play Percentage",
             f"{pass_pct:.1f}%",
             delta=f"{pass_pct - 58:.1f}% vs typical"
         )
-    
+
     with col3:
-        third_down_plays = df[df['down'] == 3]
-        if len(third_down_plays) > 0:
-            third_down_success = ((third_down_plays['yards_gained'] >= third_down_plays['ydstogo']).sum() / 
-                                len(third_down_plays))
-        else:
-            third_down_success = 0
+        third_down_success = by_down['conv_rate'].get(3, 0)
         st.metric("Third Down Success Rate", f"{third_down_success:.1%}")
-    
+
     with col4:
-        red_zone_plays = df[df['red_zone'] == 1] if 'red_zone' in df.columns else df[df['distance_to_goal'] <= 20]
-        red_zone_avg = red_zone_plays['yards_gained'].mean() if len(red_zone_plays) > 0 else 0
+        rz_yards = yards[rz_mask]
+        red_zone_avg = rz_yards.mean() if len(rz_yards) > 0 else 0
         st.metric("Red Zone Average", f"{red_zone_avg:.2f} yards")
     
-    # performance analysis charts
-    st.markdown('<div class="subsection-header">Performance Analysis</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # yards by down analysis
-        down_stats = df.groupby('down').agg({
-            'yards_gained': ['mean', 'count']
-        }).round(2)
-        down_stats.columns = ['Average Yards', 'Play Count']
-        
-        fig1 = px.bar(
-            down_stats.reset_index(),
-            x='down',
-            y='Average Yards',
-            title="Average Yards Gained by Down",
-            color='Average Yards',
-            color_continuous_scale='Blues',
-            text='Average Yards'
-        )
-        
-        fig1.update_traces(
-            texttemplate='%{text:.1f}',
-            textposition='outside',
-            textfont=dict(size=12)
-        )
-        
-        fig1.update_layout(
-            showlegend=False,
+    # chart sections live in tabs so the browser only paints the active one;
+    # the aggregates behind them are cached and computed once up front
+    play_effectiveness, success_by_situation = _down_play_aggs(len(df), df)
+    zone_analysis = _zone_analysis(len(df), df)
+
+    perf_tab, field_tab, success_tab = st.tabs(
+        ["Performance Analysis", "Field Position Impact", "Success Rate Analysis"]
+    )
+
+    with perf_tab:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # yards by down analysis (reuses the per-down pass from the KPI section)
+            down_stats = by_down[['avg_yards', 'play_count']].round(2)
+            down_stats.columns = ['Average Yards', 'Play Count']
+
+            fig1 = px.bar(
+                down_stats.reset_index(),
+                x='down',
+                y='Average Yards',
+                title="Average Yards Gained by Down",
+                color='Average Yards',
+                color_continuous_scale='Blues',
+                text='Average Yards'
+            )
+
+            fig1.update_traces(
+                texttemplate='%{text:.1f}',
+                textposition='outside',
+                textfont=dict(size=12)
+            )
+
+            fig1.update_layout(
+                showlegend=False,
+                font=dict(family="Inter, sans-serif"),
+                plot_bgcolor='white',
+                paper_bgcolor='white',
+                title=dict(font=dict(size=16))
+            )
+
+            st.plotly_chart(fig1, use_container_width=True)
+
+        with col2:
+            # play type effectiveness (shares the fused scan with the
+            # success-rate tab)
+            fig2 = px.bar(
+                play_effectiveness,
+                x='down',
+                y='yards_gained',
+                color='play_type',
+                barmode='group',
+                title="Effectiveness by Down and Play Type",
+                color_discrete_map={'run': '#ef4444', 'pass': '#3b82f6'}
+            )
+
+            fig2.update_layout(
+                font=dict(family="Inter, sans-serif"),
+                plot_bgcolor='white',
+                paper_bgcolor='white',
+                title=dict(font=dict(size=16)),
+                legend=dict(title="Play Type")
+            )
+
+            st.plotly_chart(fig2, use_container_width=True)
+
+    with field_tab:
+        # the aggregate is ten rows at most; go.Bar traces skip px's dataframe
+        # scan and trace-splitting entirely
+        fig3 = go.Figure([
+            go.Bar(
+                x=zone_analysis.loc[zone_analysis['play_type'] == play, 'field_zone'],
+                y=zone_analysis.loc[zone_analysis['play_type'] == play, 'Average Yards'],
+                name=play,
+                marker_color=color
+            )
+            for play, color in _PLAY_COLORS
+        ])
+
+        fig3.update_layout(
+            barmode='group',
+            title=dict(text="Expected Yards by Field Position Zone", font=dict(size=16)),
+            yaxis_title="Average Yards",
             font=dict(family="Inter, sans-serif"),
             plot_bgcolor='white',
             paper_bgcolor='white',
-            title=dict(font=dict(size=16))
+            legend=dict(title="Play Type")
         )
-        
-        st.plotly_chart(fig1, use_container_width=True)
-    
-    with col2:
-        # play type effectiveness
-        play_effectiveness = df.groupby(['down', 'play_type'])['yards_gained'].mean().reset_index()
-        
-        fig2 = px.bar(
-            play_effectiveness,
-            x='down',
-            y='yards_gained',
-            color='play_type',
+
+        fig3.update_xaxes(tickangle=45)
+        st.plotly_chart(fig3, use_container_width=True)
+
+    with success_tab:
+        fig4 = go.Figure([
+            go.Bar(
+                x=success_by_situation.loc[success_by_situation['play_type'] == play, 'down'],
+                y=success_by_situation.loc[success_by_situation['play_type'] == play, 'success_rate'],
+                name=play,
+                marker_color=color
+            )
+            for play, color in _PLAY_COLORS
+        ])
+
+        fig4.update_layout(
             barmode='group',
-            title="Effectiveness by Down and Play Type",
-            color_discrete_map={'run': '#ef4444', 'pass': '#3b82f6'}
-        )
-        
-        fig2.update_layout(
+            title=dict(text="Play Success Rate by Down", font=dict(size=16)),
+            yaxis_title="Success Rate",
+            yaxis_tickformat='.1%',
             font=dict(family="Inter, sans-serif"),
             plot_bgcolor='white',
             paper_bgcolor='white',
-            title=dict(font=dict(size=16)),
             legend=dict(title="Play Type")
         )
-        
-        st.plotly_chart(fig2, use_container_width=True)
-    
-    # field position impact analysis
-    st.markdown('<div class="subsection-header">Field Position Impact</div>', unsafe_allow_html=True)
-    
-    # create field zones for analysis
-    df['field_zone'] = pd.cut(
-        df['distance_to_goal'],
-        bins=[0, 10, 20, 40, 60, 100],
-        labels=['Goal Line (1-10)', 'Red Zone (11-20)', 'Short Field (21-40)', 'Mid Field (41-60)', 'Long Field (61+)']
-    )
-    
-    zone_analysis = df.groupby(['field_zone', 'play_type']).agg({
-        'yards_gained': ['mean', 'count']
-    }).round(2)
-    
-    zone_analysis.columns = ['Average Yards', 'Play Count']
-    zone_analysis = zone_analysis.reset_index()
-    
-    fig3 = px.bar(
-        zone_analysis,
-        x='field_zone',
-        y='Average Yards',
-        color='play_type',
-        barmode='group',
-        title="Expected Yards by Field Position Zone",
-        color_discrete_map={'run': '#ef4444', 'pass': '#3b82f6'}
-    )
-    
-    fig3.update_layout(
-        font=dict(family="Inter, sans-serif"),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        title=dict(font=dict(size=16)),
-        legend=dict(title="Play Type")
-    )
-    
-    fig3.update_xaxes(tickangle=45)
-    st.plotly_chart(fig3, use_container_width=True)
-    
-    # success rate analysis
-    st.markdown('<div class="subsection-header">Success Rate Analysis</div>', unsafe_allow_html=True)
-    
-    # define success as gaining required yards
-    df['success'] = df['yards_gained'] >= df['ydstogo']
-    
-    success_by_situation = df.groupby(['down', 'play_type'])['success'].agg(['mean', 'count']).reset_index()
-    success_by_situation.columns = ['down', 'play_type', 'success_rate', 'total_plays']
-    
-    fig4 = px.bar(
-        success_by_situation,
-        x='down',
-        y='success_rate',
-        color='play_type',
-        barmode='group',
-        title="Play Success Rate by Down",
-        color_discrete_map={'run': '#ef4444', 'pass': '#3b82f6'}
-    )
-    
-    fig4.update_layout(
-        yaxis_title="Success Rate",
-        yaxis_tickformat='.1%',
-        font=dict(family="Inter, sans-serif"),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        title=dict(font=dict(size=16)),
-        legend=dict(title="Play Type")
-    )
-    
-    st.plotly_chart(fig4, use_container_width=True) 
\ No newline at end of file
+
+        st.plotly_chart(fig4, use_container_width=True)
\ No newline at end of file
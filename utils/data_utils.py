@@ -1,12 +1,16 @@
-import streamlit as st
-from src.model import ExpectedYardsModel
-from src.data_processing import load_and_prepare_data
+import gc
 import os
 
-@st.cache_resource
+import streamlit as st
+
+# src.model pulls in xgboost/sklearn and src.data_processing pulls in pandas;
+# both are imported lazily below so app.py's cold start doesn't pay for them
+
+@st.cache_resource(show_spinner=False)
 def load_model():
     """Load existing trained model"""
     try:
+        from src.model import ExpectedYardsModel
         model = ExpectedYardsModel()
         
         if os.path.exists('models/expected_yards_model.pkl'):
@@ -21,6 +25,9 @@ def load_model():
 
 def train_model_with_progress():
     try:
+        from src.data_processing import load_and_prepare_data
+        from src.model import ExpectedYardsModel
+
         progress_container = st.container()
         with progress_container:
             st.markdown("### 🔄 Training NFL Play Intelligence Model")
@@ -68,8 +75,13 @@ def train_model_with_progress():
             Click any page in the sidebar to start analyzing plays.
             """)
             
+            # Drop every reference to the pre-training model before the rerun
+            # reloads the new one, so both boosters never reside in memory at once
             st.cache_resource.clear()
-            
+            st.cache_data.clear()
+            st.session_state.pop("model", None)
+            gc.collect()
+
             return True
             
     except Exception as e:
@@ -82,11 +94,30 @@ def train_model_with_progress():
         """)
         return False
 
-@st.cache_data
+@st.cache_data(max_entries=4096, show_spinner=False)
+def cached_recommendation(_model, down, ydstogo, yardline_100, quarter, score_diff):
+    """
+    Memoized play recommendation for a game situation.
+    The leading underscore keeps Streamlit from hashing the model; the five
+    integer inputs form the cache key, so repeated slider states skip inference.
+    """
+    from src.data_processing import get_play_features
+    features = get_play_features(down, ydstogo, yardline_100, quarter, score_diff)
+    return _model.recommend_play_type(features)
+
+@st.cache_data(show_spinner=False)
 def load_data():
     try:
+        from src.data_processing import PAGE_COLUMNS, load_and_prepare_data, load_prepared_data, save_prepared_data
         with st.spinner("Loading NFL analytics data..."):
-            X, y, feature_names, df = load_and_prepare_data()
+            df = load_prepared_data()
+            if df is None:
+                X, y, feature_names, df = load_and_prepare_data()
+                if df is not None and len(df) > 0:
+                    save_prepared_data(df)
+                    # keep only the columns the pages read; the Parquet path
+                    # already projects, this trims the fresh-download path too
+                    df = df[[col for col in PAGE_COLUMNS if col in df.columns]]
             if df is None or len(df) == 0:
                 st.error("**Data Loading Error:** No valid data could be loaded")
                 st.info("Please check your internet connection and try again")
@@ -103,88 +134,3 @@ def load_data():
         3. If the problem persists, the data source might be temporarily unavailable
         """)
         return None
-
-def display_setup_instructions():
-    
-    # Hero Section
-    st.markdown("""
-    <div style="text-align: center; padding: 2rem 0;">
-        <h1 style="font-size: 3rem; margin-bottom: 1rem; background: linear-gradient(45deg, #2563eb, #059669); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">
-            🏈 NFL Play Intelligence System
-        </h1>
-        <p style="font-size: 1.25rem; color: #64748b; margin-bottom: 2rem;">
-            Machine Learning-Powered Play Calling Intelligence • Powered by Real NFL Data
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Main content in columns
-    col1, col2 = st.columns([3, 2])
-    
-    with col1:
-        st.markdown("""
-        <div class="info-card">
-            <h2>What This App Does</h2>
-            <p>The NFL Play Intelligence System uses machine learning to analyze real NFL play-by-play data and provide intelligent recommendations for play calling based on game situations.</p>
-            <ul>
-                <li>Play Predictor: Get AI recommendations for run vs pass based on down, distance, field position, and game context</li>
-                <li>Analytics Dashboard: Explore comprehensive NFL statistics and trends</li>
-                <li>Model Insights: Understand which factors most influence play success</li>
-                <li>Scenario Simulator: Test different game situations and see expected outcomes</li>
-                <li>Data Explorer: Dive deep into real NFL play-by-play data</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="metric-card">
-            <h3>How It Works</h3>
-            <ol>
-                <li>Data Collection: Downloads real NFL play-by-play data from nflfastR (public repository)</li>
-                <li>Feature Engineering: Creates 37 advanced features including situational context, field position, and game state</li>
-                <li>Model Training: Uses XGBoost regression to predict expected yards for run vs pass plays</li>
-                <li>Intelligent Recommendations: Provides contextual advice based on predicted outcomes</li>
-            </ol>
-        </div>
-        """, unsafe_allow_html=True)
-    with col2:
-        st.markdown("""
-        <div class="success-card">
-            <h3>Model Specifications</h3>
-            <ul>
-                <li><strong>Data Source:</strong> nflfastR Public API</li>
-                <li><strong>Seasons:</strong> 2019-2021 NFL Data</li>
-                <li><strong>Data Volume:</strong> 20,000+ Real Plays</li>
-                <li><strong>Algorithm:</strong> XGBoost Regression</li>
-                <li><strong>Features:</strong> 37 Engineered Variables</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="warning-card">
-            <h3>⚡ Quick Start</h3>
-            <p><strong>First Time Setup:</strong></p>
-            <p>Click the "Train Model" button below to:</p>
-            <ul>
-                <li>📥 Download real NFL data</li>
-                <li>🧠 Train the AI model</li>
-                <li>💾 Save for instant access</li>
-            </ul>
-            <p><strong>Time Required:</strong> 2-3 minutes</p>
-            <p><strong>Internet Required:</strong> Yes (for data download)</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Training Section
-    st.markdown("---")
-    st.markdown("### 🚀 Ready to Get Started?")
-    
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("🎯 Train Model", type="primary", help="Start the AI model training process", use_container_width=True):
-            st.markdown("---")
-            success = train_model_with_progress()
-            if success:
-                st.balloons()
-                st.rerun()